@@ -6,14 +6,17 @@ import json
 import random
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
 from math import log1p
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from polymarket_api import (
     GAMMA_API_BASE,
@@ -276,6 +279,23 @@ MARKET_CATEGORY_KEYWORDS = {
 }
 
 
+@lru_cache(maxsize=8192)
+def _parse_end_dt(end_date: str) -> datetime:
+    """Parse a market endDate into an aware UTC datetime.
+    
+    Memoized because the same markets (and endDate strings) come back on
+    every ordering and every scan cycle.
+    """
+    if end_date.endswith('Z'):
+        end_dt = datetime.fromisoformat(end_date.replace('Z', '+00:00'))
+    else:
+        end_dt = datetime.fromisoformat(end_date)
+    
+    if end_dt.tzinfo is None:
+        end_dt = end_dt.replace(tzinfo=timezone.utc)
+    return end_dt
+
+
 class AutoTradingBot:
     """
     Auto-trading bot that:
@@ -286,6 +306,7 @@ class AutoTradingBot:
     """
     
     EXCHANGE_FEE = 0.02  # 2% fee
+    HTTP_POOL_SIZE = 8  # Keep-alive connections to the Gamma API
     
     def __init__(
         self,
@@ -330,12 +351,26 @@ class AutoTradingBot:
         # Trade history log (for UI display)
         self.trade_log: List[Dict] = []  # Recent trades with outcomes
         
+        # Shared HTTP session so market fetches reuse TCP/TLS connections
+        # across orderings and scan cycles (requests already sends
+        # Accept-Encoding: gzip and keeps connections alive)
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=self.HTTP_POOL_SIZE,
+        ))
+        # Worker pool for those fetches, shared by every scan/update cycle
+        # while the bot runs; created on first use and shut down in stop()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        
         # News analyzer (if available)
         self._news_analyzer: Optional[NewsAnalyzer] = None
         if NEWS_ANALYZER_AVAILABLE and self.config.use_news_analysis:
             self._news_analyzer = NewsAnalyzer(
                 cache_duration_minutes=10,
                 on_signal=self._on_news_signal,
+                cache_dir=self.storage_path.parent / "news_cache",
             )
         
         # Cloud sync for multi-user support
@@ -464,6 +499,13 @@ class AutoTradingBot:
             cutoff = now - timedelta(hours=1)
             self._scanned_times = {k: v for k, v in self._scanned_times.items() if v > cutoff}
             
+            # Drop cached opportunities along with them, keeping held markets
+            # for update_positions' price fallback
+            self.scanned_markets = {
+                k: v for k, v in self.scanned_markets.items()
+                if v.market_id in self._scanned_times or v.market_id in owned_market_ids
+            }
+            
         except Exception as e:
             self._log(f"❌ Scan failed: {e}", "error")
         
@@ -484,20 +526,12 @@ class AutoTradingBot:
                 ("startDate", "false"),    # Newest markets
             ]
             
-            for order_by, ascending in orderings:
-                try:
-                    params = {
-                        "active": "true",
-                        "closed": "false",
-                        "limit": 80,
-                        "order": order_by,
-                        "ascending": ascending,
-                    }
-                    response = requests.get(url, params=params, timeout=15)
-                    if response.ok:
-                        all_markets.extend(response.json())
-                except Exception:
-                    continue
+            # Fetch all orderings concurrently; results come back in order so
+            # de-duplication below still prefers the earlier orderings
+            for future in self._run_concurrently(
+                lambda ordering: self._fetch_market_page(url, *ordering), orderings
+            ):
+                all_markets.extend(future.result())
             
             # Remove duplicates
             seen = set()
@@ -526,14 +560,7 @@ class AutoTradingBot:
                 
                 # Parse and validate end date
                 try:
-                    if end_date_str.endswith('Z'):
-                        end_dt = datetime.fromisoformat(end_date_str.replace('Z', '+00:00'))
-                    else:
-                        end_dt = datetime.fromisoformat(end_date_str)
-                    
-                    if end_dt.tzinfo is None:
-                        end_dt = end_dt.replace(tzinfo=timezone.utc)
-                    
+                    end_dt = _parse_end_dt(end_date_str)
                     if end_dt <= now:
                         continue
                     
@@ -608,6 +635,56 @@ class AutoTradingBot:
             self._log(f"Failed to fetch markets: {e}", "error")
             return []
     
+    def _get_executor(self) -> Optional[ThreadPoolExecutor]:
+        """Return the shared HTTP worker pool, or None when the bot is not running."""
+        with self._executor_lock:
+            if self._executor is None and self._running:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.HTTP_POOL_SIZE,
+                    thread_name_prefix="auto-trader-http",
+                )
+            return self._executor
+    
+    def _run_concurrently(self, fn: Callable, items: List) -> List[Future]:
+        """
+        Run fn over items on the shared pool, in order. Items run inline when
+        there is no pool (manual scans, or stop() shut it down mid-cycle).
+        """
+        futures: List[Future] = []
+        executor = self._get_executor()
+        if executor is not None:
+            try:
+                for item in items:
+                    futures.append(executor.submit(fn, item))
+            except RuntimeError:
+                pass  # Shut down by stop(); finish the remaining items inline
+        
+        for item in items[len(futures):]:
+            future: Future = Future()
+            try:
+                future.set_result(fn(item))
+            except Exception as e:
+                future.set_exception(e)
+            futures.append(future)
+        return futures
+    
+    def _fetch_market_page(self, url: str, order_by: str, ascending: str) -> List[Dict]:
+        """Fetch one page of active markets for a given ordering."""
+        try:
+            params = {
+                "active": "true",
+                "closed": "false",
+                "limit": 80,
+                "order": order_by,
+                "ascending": ascending,
+            }
+            response = self._session.get(url, params=params, timeout=15)
+            if response.ok:
+                return response.json()
+        except Exception:
+            pass
+        return []
+    
     def _evaluate_market(self, market: Dict) -> Optional[MarketOpportunity]:
         """Evaluate a market for trading opportunity."""
         market_id = market.get("slug") or str(market.get("id"))
@@ -622,10 +699,13 @@ class AutoTradingBot:
         if not end_date:
             return None
         
-        try:
-            resolution_days = compute_resolution_days(end_date)
-        except Exception:
-            return None
+        # _fetch_active_markets already parsed endDate during this scan
+        resolution_days = market.get("_resolution_days")
+        if resolution_days is None:
+            try:
+                resolution_days = compute_resolution_days(end_date)
+            except Exception:
+                return None
         
         # Check day bounds
         if resolution_days < self.config.min_days or resolution_days > self.config.max_days:
@@ -1079,32 +1159,14 @@ class AutoTradingBot:
         # Fetch ALL held position prices (no limit - these are critical)
         market_prices = {}  # market_id -> {outcome -> price}
         
-        for slug in market_slugs:
+        # Fetch concurrently; each slug is an independent network round-trip
+        futures = dict(zip(market_slugs, self._run_concurrently(self._fetch_outcome_prices, market_slugs)))
+        
+        for slug, future in futures.items():
             try:
-                url = f"{GAMMA_API_BASE}/markets"
-                response = requests.get(url, params={"slug": slug}, timeout=5)  # 5s timeout for held positions
-                if response.ok:
-                    data = response.json()
-                    market_data = data[0] if isinstance(data, list) and data else data if isinstance(data, dict) else None
-                    
-                    if market_data:
-                        prices = market_data.get("outcomePrices")
-                        outcomes = market_data.get("outcomes")
-                        
-                        if prices and outcomes:
-                            try:
-                                if isinstance(prices, str):
-                                    prices = json.loads(prices)
-                                if isinstance(outcomes, str):
-                                    outcomes = json.loads(outcomes)
-                                
-                                market_prices[slug] = {
-                                    outcomes[i]: float(prices[i]) 
-                                    for i in range(len(outcomes)) 
-                                    if i < len(prices)
-                                }
-                            except Exception:
-                                pass
+                prices = future.result()
+                if prices is not None:
+                    market_prices[slug] = prices
             except requests.Timeout:
                 self._log(f"⚠️ Timeout fetching {slug} - using cached price", "alert")
                 continue
@@ -1154,6 +1216,37 @@ class AutoTradingBot:
             except Exception:
                 continue
     
+    def _fetch_outcome_prices(self, slug: str) -> Optional[Dict[str, float]]:
+        """Fetch current outcome -> price for a held market. Raises requests.Timeout."""
+        url = f"{GAMMA_API_BASE}/markets"
+        response = self._session.get(url, params={"slug": slug}, timeout=5)  # 5s timeout for held positions
+        if not response.ok:
+            return None
+        
+        data = response.json()
+        market_data = data[0] if isinstance(data, list) and data else data if isinstance(data, dict) else None
+        if not market_data:
+            return None
+        
+        prices = market_data.get("outcomePrices")
+        outcomes = market_data.get("outcomes")
+        if not prices or not outcomes:
+            return None
+        
+        try:
+            if isinstance(prices, str):
+                prices = json.loads(prices)
+            if isinstance(outcomes, str):
+                outcomes = json.loads(outcomes)
+            
+            return {
+                outcomes[i]: float(prices[i]) 
+                for i in range(len(outcomes)) 
+                if i < len(prices)
+            }
+        except Exception:
+            return None
+    
     def _close_trade(self, trade: BotTrade, exit_price: float, reason: str) -> None:
         """Close a trade with realistic execution simulation."""
         actual_exit_price = exit_price
@@ -1411,7 +1504,14 @@ class AutoTradingBot:
     
     def stop(self) -> None:
         """Stop auto-trading."""
-        self._running = False
+        with self._executor_lock:
+            # Cleared under the lock so _get_executor can't build a new pool
+            # after this one is shut down
+            self._running = False
+            if self._executor is not None:
+                # Let in-flight fetches finish
+                self._executor.shutdown(wait=False)
+                self._executor = None
         self._log("Auto-trading bot stopped", "info")
     
     def is_running(self) -> bool:
@@ -7,17 +7,33 @@ to help predict market movements.
 from __future__ import annotations
 
 import re
+import sys
 import json
+import os
 import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from enum import Enum
 import hashlib
+import heapq
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import xml.etree.ElementTree as ET
+from itertools import islice
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Optional C automaton for single-pass keyword matching
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 
 class Sentiment(Enum):
@@ -43,6 +59,11 @@ class MarketCategory(Enum):
 @dataclass
 class NewsArticle:
     """A news article with sentiment analysis."""
+    __slots__ = (
+        "title", "source", "url", "timestamp", "content_snippet",
+        "keywords", "sentiment_score", "relevance_score",
+    )
+    
     title: str
     source: str
     url: str
@@ -56,6 +77,11 @@ class NewsArticle:
 @dataclass
 class MarketSignal:
     """A trading signal based on news analysis."""
+    __slots__ = (
+        "market_id", "market_question", "category", "sentiment", "sentiment_score",
+        "confidence", "news_articles", "recommendation", "reasons", "timestamp",
+    )
+    
     market_id: str
     market_question: str
     category: MarketCategory
@@ -68,8 +94,13 @@ class MarketSignal:
     timestamp: str
 
 
+def _keyword_set(words) -> frozenset:
+    """Freeze a keyword collection, interning each word."""
+    return frozenset(sys.intern(w) for w in words)
+
+
 # Keyword dictionaries for sentiment analysis
-BULLISH_KEYWORDS = {
+BULLISH_KEYWORDS = _keyword_set({
     "win", "winning", "victory", "success", "surge", "rally", "breakthrough",
     "approve", "approved", "approval", "pass", "passed", "passing",
     "increase", "rise", "rising", "gain", "positive", "confirm", "confirmed",
@@ -78,9 +109,9 @@ BULLISH_KEYWORDS = {
     "record", "high", "boost", "soar", "jump", "spike", "bullish",
     "agree", "agreement", "deal", "partnership", "alliance", "succeed",
     "progress", "advance", "improvement", "better", "best", "top",
-}
+})
 
-BEARISH_KEYWORDS = {
+BEARISH_KEYWORDS = _keyword_set({
     "lose", "losing", "loss", "defeat", "fail", "failed", "failure",
     "reject", "rejected", "rejection", "deny", "denied", "decline",
     "decrease", "drop", "fall", "falling", "negative", "concern",
@@ -90,55 +121,238 @@ BEARISH_KEYWORDS = {
     "disagree", "dispute", "conflict", "tension", "risk", "threat",
     "delay", "postpone", "suspend", "cancel", "withdraw", "quit",
     "scandal", "controversy", "investigation", "lawsuit", "charge",
-}
+})
 
 # Category detection keywords
 CATEGORY_KEYWORDS = {
-    MarketCategory.POLITICS: {
+    MarketCategory.POLITICS: _keyword_set({
         "election", "president", "congress", "senate", "governor", "vote",
         "democrat", "republican", "biden", "trump", "political", "politics",
         "legislation", "bill", "law", "policy", "campaign", "poll", "ballot",
         "primary", "caucus", "electoral", "candidate", "administration",
-    },
-    MarketCategory.CRYPTO: {
+    }),
+    MarketCategory.CRYPTO: _keyword_set({
         "bitcoin", "btc", "ethereum", "eth", "crypto", "cryptocurrency",
         "blockchain", "defi", "nft", "token", "coin", "wallet", "exchange",
         "mining", "halving", "altcoin", "solana", "cardano", "dogecoin",
-    },
-    MarketCategory.SPORTS: {
+    }),
+    MarketCategory.SPORTS: _keyword_set({
         "nba", "nfl", "mlb", "nhl", "soccer", "football", "basketball",
         "baseball", "hockey", "tennis", "golf", "ufc", "boxing", "mma",
         "championship", "playoffs", "finals", "superbowl", "world series",
         "team", "player", "game", "match", "score", "season", "league",
-    },
-    MarketCategory.ENTERTAINMENT: {
+    }),
+    MarketCategory.ENTERTAINMENT: _keyword_set({
         "movie", "film", "oscar", "emmy", "grammy", "music", "album",
         "celebrity", "hollywood", "netflix", "streaming", "tv", "show",
         "concert", "tour", "box office", "premiere", "award", "actor",
-    },
-    MarketCategory.FINANCE: {
+    }),
+    MarketCategory.FINANCE: _keyword_set({
         "stock", "market", "nasdaq", "s&p", "dow", "fed", "interest rate",
         "inflation", "gdp", "economy", "economic", "bank", "fed", "jerome powell",
         "earnings", "revenue", "profit", "ipo", "merger", "acquisition",
-    },
-    MarketCategory.TECHNOLOGY: {
+    }),
+    MarketCategory.TECHNOLOGY: _keyword_set({
         "tech", "technology", "ai", "artificial intelligence", "openai",
         "google", "apple", "microsoft", "meta", "amazon", "tesla", "nvidia",
         "startup", "silicon valley", "software", "hardware", "chip", "semiconductor",
-    },
-    MarketCategory.WORLD_EVENTS: {
+    }),
+    MarketCategory.WORLD_EVENTS: _keyword_set({
         "war", "conflict", "military", "nato", "un", "united nations",
         "russia", "ukraine", "china", "iran", "israel", "middle east",
         "climate", "environment", "disaster", "earthquake", "hurricane",
         "pandemic", "covid", "virus", "health", "who", "treaty",
-    },
-    MarketCategory.SCIENCE: {
+    }),
+    MarketCategory.SCIENCE: _keyword_set({
         "nasa", "space", "spacex", "mars", "moon", "rocket", "satellite",
         "science", "research", "study", "discovery", "scientist", "laboratory",
         "medicine", "drug", "fda", "clinical trial", "vaccine", "treatment",
-    },
+    }),
+}
+
+
+# Stop words dropped when building news search queries
+STOP_WORDS = frozenset({
+    "will", "the", "be", "to", "a", "an", "in", "on", "at", "by", "for",
+    "of", "or", "and", "is", "it", "that", "this", "with", "as", "are",
+    "was", "were", "been", "being", "have", "has", "had", "do", "does",
+    "did", "but", "if", "than", "so", "what", "when", "where", "who",
+    "which", "how", "all", "each", "every", "both", "few", "more", "most",
+    "other", "some", "such", "no", "nor", "not", "only", "own", "same",
+    "too", "very", "just", "can", "could", "may", "might", "must", "shall",
+    "should", "would", "before", "after", "during", "above", "below",
+})
+
+# Bytes read per network chunk while streaming RSS feeds
+RSS_CHUNK_SIZE = 16 * 1024
+# Leftover feed bytes read (unparsed) after the top items so the keep-alive
+# connection can go back to the pool; larger bodies close the connection
+RSS_DRAIN_LIMIT = 512 * 1024
+
+# Precompiled patterns for tokenizing
+_WORD_RE = re.compile(r'\b\w+\b')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# Union of both sentiment lists, for a quick "no sentiment words" check
+_SENTIMENT_KEYWORDS = BULLISH_KEYWORDS | BEARISH_KEYWORDS
+
+# Category keywords split into single words (matched against a token set)
+# and phrases/punctuated terms such as "world series" or "s&p". Both also
+# match a trailing "s"/"es" so plurals like "stocks" or "elections" count.
+_CATEGORY_WORDS = {
+    category: frozenset(kw for kw in keywords if re.fullmatch(r'\w+', kw))
+    for category, keywords in CATEGORY_KEYWORDS.items()
+}
+_CATEGORY_PHRASES = {
+    category: tuple(
+        re.compile(r'\b' + re.escape(kw) + r'(?:e?s)?\b')
+        for kw in sorted(keywords - _CATEGORY_WORDS[category])
+    )
+    for category, keywords in CATEGORY_KEYWORDS.items()
 }
 
+# Same mapping as _PUNCT_RE for ASCII text, as a bytes.translate table
+_ASCII_PUNCT_TABLE = bytes(
+    c if c < 128 and re.match(r'[\w\s]', chr(c)) else ord(' ') for c in range(256)
+)
+
+
+def _build_sentiment_automaton():
+    """Build an automaton mapping each sentiment keyword to (keyword, +1/-1)."""
+    automaton = ahocorasick.Automaton()
+    for kw in BULLISH_KEYWORDS:
+        automaton.add_word(kw, (kw, 1))
+    for kw in BEARISH_KEYWORDS:
+        automaton.add_word(kw, (kw, -1))
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_category_automaton():
+    """Build an automaton mapping each category keyword to (keyword, categories)."""
+    owners: Dict[str, List[MarketCategory]] = {}
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        for kw in keywords:
+            owners.setdefault(kw, []).append(category)
+    automaton = ahocorasick.Automaton()
+    for kw, categories in owners.items():
+        automaton.add_word(kw, (kw, tuple(categories)))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """True if text[start:end] is not flanked by word characters (like \\b...\\b)."""
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    if end < len(text) and _is_word_char(text[end]):
+        return False
+    return True
+
+
+def _is_whole_word_or_plural(text: str, start: int, end: int) -> bool:
+    """Like _is_whole_word, but also allows an "s"/"es" suffix after text[start:end]."""
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    for suffix in ("", "s", "es"):
+        if suffix and not text.startswith(suffix, end):
+            continue
+        stop = end + len(suffix)
+        if stop >= len(text) or not _is_word_char(text[stop]):
+            return True
+    return False
+
+
+def _plural_stems(tokens: Iterable[str]) -> frozenset:
+    """Tokens plus their forms with a trailing "s"/"es" removed."""
+    stems = set(tokens)
+    for token in tokens:
+        if token.endswith("s"):
+            stems.add(token[:-1])
+            if token.endswith("es"):
+                stems.add(token[:-2])
+    return frozenset(stems)
+
+
+if AHOCORASICK_AVAILABLE:
+    _SENTIMENT_AUTOMATON = _build_sentiment_automaton()
+    _CATEGORY_AUTOMATON = _build_category_automaton()
+
+
+def _record(chunks: Iterable[bytes], sink: List[bytes]) -> Iterator[bytes]:
+    """Pass chunks through while keeping a copy of each in `sink`."""
+    for chunk in chunks:
+        sink.append(chunk)
+        yield chunk
+
+
+def _iter_rss_items(chunks: Iterable[bytes]) -> Iterator[ET.Element]:
+    """Yield each RSS <item> element as soon as it has been fully parsed."""
+    parser = ET.XMLPullParser(events=("end",))
+    for chunk in chunks:
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            if elem.tag == "item":
+                yield elem
+
+
+class _RateLimiter:
+    """Spaces calls out across threads to at most `rate` per second."""
+    
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _TTLCache:
+    """Size-bounded, thread-safe mapping whose entries expire after `ttl` seconds."""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            return value
+    
+    def __setitem__(self, key, value) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._data.pop(key, None)
+            self._data[key] = (now + self.ttl, value)
+            # Entries share one TTL, so the oldest are also the first to expire
+            while self._data:
+                oldest_key, (expires_at, _) = next(iter(self._data.items()))
+                if len(self._data) <= self.maxsize and expires_at > now:
+                    break
+                del self._data[oldest_key]
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
 
 class NewsAnalyzer:
     """
@@ -157,47 +371,113 @@ class NewsAnalyzer:
         {"name": "Google News", "type": "rss", "url": "https://news.google.com/rss/search?q={query}&hl=en-US&gl=US&ceid=US:en"},
     ]
     
+    # Background analysis concurrency (RSS fetches are I/O bound)
+    ANALYSIS_WORKERS = 16
+    ANALYSIS_REQUESTS_PER_SECOND = 10.0  # Cap on RSS requests sent to Google News
+    
+    # Upper bound on cached queries/signals kept in memory
+    CACHE_MAX_ENTRIES = 4096
+    
+    # On-disk RSS cache: size cap, and writes between expiry sweeps
+    DISK_CACHE_MAX_BYTES = 64 * 1024 * 1024
+    DISK_CACHE_PRUNE_EVERY = 256
+    
     def __init__(
         self,
         cache_duration_minutes: int = 15,
         on_signal: Optional[Callable[[MarketSignal], None]] = None,
+        cache_dir: Optional[Path] = None,
     ):
         self.cache_duration = timedelta(minutes=cache_duration_minutes)
         self.on_signal = on_signal
         
-        # Cache
-        self._news_cache: Dict[str, Tuple[datetime, List[NewsArticle]]] = {}
-        self._signal_cache: Dict[str, MarketSignal] = {}
+        # Optional on-disk copy of raw RSS responses that survives restarts
+        self.cache_dir = cache_dir
+        self._disk_cache_lock = threading.Lock()
+        self._disk_cache_bytes = 0  # Running size of the cached files
+        self._disk_writes_since_prune = 0
+        if self.cache_dir is not None:
+            with self._disk_cache_lock:
+                self._prune_disk_cache()
+        
+        # Cache (bounded, entries expire after cache_duration)
+        ttl = self.cache_duration.total_seconds()
+        self._news_cache = _TTLCache(self.CACHE_MAX_ENTRIES, ttl)  # search query -> List[NewsArticle]
+        self._signal_cache = _TTLCache(self.CACHE_MAX_ENTRIES, ttl)  # market_id -> MarketSignal
+        self._inflight: Dict[str, Future] = {}  # search query -> pending fetch
+        self._inflight_lock = threading.Lock()
         
         # Running state
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._markets_to_analyze: Dict[str, Dict] = {}  # market_id -> market_info
+        self._rate_limiter = _RateLimiter(self.ANALYSIS_REQUESTS_PER_SECOND)
+        
+        # Shared HTTP session so RSS fetches reuse keep-alive connections
+        self._session = requests.Session()
+        self._session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+        self._session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=self.ANALYSIS_WORKERS,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        ))
     
     def detect_category(self, text: str) -> MarketCategory:
         """Detect the category of a market based on its question/description."""
         text_lower = text.lower()
         
-        category_scores = {}
-        for category, keywords in CATEGORY_KEYWORDS.items():
-            score = sum(1 for kw in keywords if kw in text_lower)
-            if score > 0:
-                category_scores[category] = score
+        if AHOCORASICK_AVAILABLE:
+            # One pass over the text finds every whole-word (or plural) keyword
+            hits: Dict[MarketCategory, int] = {}
+            matched = {
+                value for end, value in _CATEGORY_AUTOMATON.iter(text_lower)
+                if _is_whole_word_or_plural(text_lower, end - len(value[0]) + 1, end + 1)
+            }
+            for _, categories in matched:
+                for category in categories:
+                    hits[category] = hits.get(category, 0) + 1
+            # Keep CATEGORY_KEYWORDS order so ties resolve as before
+            category_scores = {c: hits[c] for c in CATEGORY_KEYWORDS if c in hits}
+        else:
+            # Tokenize once; single words become set lookups, phrases a short scan
+            tokens = _plural_stems(_WORD_RE.findall(text_lower))
+            category_scores = {}
+            for category, words in _CATEGORY_WORDS.items():
+                score = len(tokens & words)
+                score += sum(1 for phrase in _CATEGORY_PHRASES[category] if phrase.search(text_lower))
+                if score > 0:
+                    category_scores[category] = score
         
         if category_scores:
             return max(category_scores, key=category_scores.get)
         return MarketCategory.OTHER
     
-    def analyze_sentiment(self, text: str) -> Tuple[float, Sentiment]:
+    def analyze_sentiment(self, text: str, is_lower: bool = False) -> Tuple[float, Sentiment]:
         """
         Analyze sentiment of text.
+        Pass is_lower=True when the caller has already lowercased `text`.
         Returns (score: -1 to +1, sentiment_enum)
         """
-        text_lower = text.lower()
-        words = set(re.findall(r'\b\w+\b', text_lower))
-        
-        bullish_count = len(words & BULLISH_KEYWORDS)
-        bearish_count = len(words & BEARISH_KEYWORDS)
+        text_lower = text if is_lower else text.lower()
+        
+        if AHOCORASICK_AVAILABLE:
+            # Single scan; only count matches that sit on word boundaries
+            matched: Dict[str, int] = {}
+            for end, (kw, sign) in _SENTIMENT_AUTOMATON.iter(text_lower):
+                if _is_whole_word(text_lower, end - len(kw) + 1, end + 1):
+                    matched[kw] = sign
+            bullish_count = sum(1 for sign in matched.values() if sign > 0)
+            bearish_count = len(matched) - bullish_count
+        else:
+            words = set(_WORD_RE.findall(text_lower))
+            # Most headlines carry no sentiment words; bail before intersecting
+            if words.isdisjoint(_SENTIMENT_KEYWORDS):
+                return 0.0, Sentiment.NEUTRAL
+            bullish_count = len(words & BULLISH_KEYWORDS)
+            bearish_count = len(words & BEARISH_KEYWORDS)
         
         total = bullish_count + bearish_count
         if total == 0:
@@ -221,28 +501,94 @@ class NewsAnalyzer:
     
     def _extract_keywords(self, question: str) -> List[str]:
         """Extract searchable keywords from a market question."""
-        # Remove common words
-        stop_words = {
-            "will", "the", "be", "to", "a", "an", "in", "on", "at", "by", "for",
-            "of", "or", "and", "is", "it", "that", "this", "with", "as", "are",
-            "was", "were", "been", "being", "have", "has", "had", "do", "does",
-            "did", "but", "if", "than", "so", "what", "when", "where", "who",
-            "which", "how", "all", "each", "every", "both", "few", "more", "most",
-            "other", "some", "such", "no", "nor", "not", "only", "own", "same",
-            "too", "very", "just", "can", "could", "may", "might", "must", "shall",
-            "should", "would", "before", "after", "during", "above", "below",
-        }
-        
-        # Clean and tokenize
-        text = re.sub(r'[^\w\s]', ' ', question.lower())
+        # Clean and tokenize (ASCII text takes a byte-table lookup, no regex)
+        text = question.lower()
+        if text.isascii():
+            text = text.encode('ascii').translate(_ASCII_PUNCT_TABLE).decode('ascii')
+        else:
+            text = _PUNCT_RE.sub(' ', text)
         words = text.split()
         
-        # Filter
-        keywords = [w for w in words if w not in stop_words and len(w) > 2]
-        
         # Return top keywords (prioritize longer/specific words)
-        keywords.sort(key=len, reverse=True)
-        return keywords[:5]
+        return heapq.nlargest(
+            5, (w for w in words if w not in STOP_WORDS and len(w) > 2), key=len
+        )
+    
+    def _disk_cache_path(self, url: str) -> Path:
+        digest = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.xml"
+    
+    def _read_disk_cache(self, url: str) -> Optional[bytes]:
+        """Return a cached RSS response if one is younger than cache_duration."""
+        if self.cache_dir is None:
+            return None
+        path = self._disk_cache_path(url)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age < self.cache_duration.total_seconds():
+                return path.read_bytes()
+        except OSError:
+            pass
+        return None
+    
+    def _write_disk_cache(self, url: str, content: bytes) -> None:
+        if self.cache_dir is None:
+            return
+        path = self._disk_cache_path(url)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            old_size = path.stat().st_size
+        except OSError:
+            old_size = 0
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        
+        with self._disk_cache_lock:
+            self._disk_cache_bytes += len(content) - old_size
+            self._disk_writes_since_prune += 1
+            if (self._disk_cache_bytes > self.DISK_CACHE_MAX_BYTES
+                    or self._disk_writes_since_prune >= self.DISK_CACHE_PRUNE_EVERY):
+                self._prune_disk_cache()
+    
+    def _prune_disk_cache(self) -> None:
+        """
+        Delete expired RSS responses, then the oldest ones until the cache
+        fits in DISK_CACHE_MAX_BYTES. Caller holds _disk_cache_lock.
+        """
+        cutoff = time.time() - self.cache_duration.total_seconds()
+        entries: List[Tuple[float, int, Path]] = []
+        total = 0
+        try:
+            for path in self.cache_dir.glob("*.xml"):
+                try:
+                    stat = path.stat()
+                    if stat.st_mtime < cutoff:
+                        path.unlink()
+                    else:
+                        entries.append((stat.st_mtime, stat.st_size, path))
+                        total += stat.st_size
+                except OSError:
+                    continue
+        except OSError:
+            pass
+        
+        if total > self.DISK_CACHE_MAX_BYTES:
+            entries.sort()
+            for _, size, path in entries:
+                if total <= self.DISK_CACHE_MAX_BYTES:
+                    break
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                total -= size
+        
+        self._disk_cache_bytes = total
+        self._disk_writes_since_prune = 0
     
     def _fetch_news_rss(self, query: str) -> List[NewsArticle]:
         """Fetch news from Google News RSS."""
@@ -253,40 +599,58 @@ class NewsAnalyzer:
             encoded_query = requests.utils.quote(query)
             url = f"https://news.google.com/rss/search?q={encoded_query}&hl=en-US&gl=US&ceid=US:en"
             
-            response = requests.get(url, timeout=10, headers={
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
-            response.raise_for_status()
+            # Parse XML incrementally with the stdlib parser (handles entities
+            # and CDATA) and stop reading once the top 10 items are complete
+            content = self._read_disk_cache(url)
+            if content is not None:
+                items = list(islice(_iter_rss_items([content]), 10))
+            else:
+                received: List[bytes] = []
+                # Only real RSS requests count against the rate limit
+                self._rate_limiter.wait()
+                with self._session.get(url, timeout=10, stream=True) as response:
+                    response.raise_for_status()
+                    chunks = response.iter_content(chunk_size=RSS_CHUNK_SIZE)
+                    items = list(islice(_iter_rss_items(_record(chunks, received)), 10))
+                    # Closing a partly read response drops the socket, so read
+                    # out the rest of a normal-sized feed without parsing it
+                    drained = 0
+                    for chunk in chunks:
+                        drained += len(chunk)
+                        if drained > RSS_DRAIN_LIMIT:
+                            break
+                # Only the prefix holding those items is needed on a later hit
+                self._write_disk_cache(url, b"".join(received))
             
-            # Parse XML (simple regex parsing to avoid lxml dependency)
-            content = response.text
+            fetched_at: Optional[str] = None  # Fallback timestamp, formatted on first use
             
-            # Extract items
-            items = re.findall(r'<item>(.*?)</item>', content, re.DOTALL)
+            query_words = frozenset(query.lower().split())
             
-            for item in items[:10]:  # Top 10 articles
-                title_match = re.search(r'<title>(.*?)</title>', item)
-                link_match = re.search(r'<link>(.*?)</link>', item)
-                pub_date_match = re.search(r'<pubDate>(.*?)</pubDate>', item)
-                source_match = re.search(r'<source.*?>(.*?)</source>', item)
+            for item in items:  # Top 10 articles
+                title = item.findtext('title')
+                url = item.findtext('link')
+                pub_date = item.findtext('pubDate')
+                source = item.findtext('source')
                 
-                if title_match and link_match:
-                    title = title_match.group(1).strip()
-                    # Clean HTML entities
-                    title = title.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>')
-                    title = title.replace('&#39;', "'").replace('&quot;', '"')
-                    
-                    url = link_match.group(1).strip()
-                    source = source_match.group(1).strip() if source_match else "Google News"
-                    pub_date = pub_date_match.group(1).strip() if pub_date_match else datetime.now(timezone.utc).isoformat()
+                if title is not None and url is not None:
+                    # ElementTree has already decoded the XML entities
+                    title = title.strip()
+                    url = url.strip()
+                    source = source.strip() if source is not None else "Google News"
+                    if pub_date is not None:
+                        pub_date = pub_date.strip()
+                    else:
+                        if fetched_at is None:
+                            fetched_at = datetime.now(timezone.utc).isoformat()
+                        pub_date = fetched_at
                     
                     # Analyze sentiment
-                    sentiment_score, _ = self.analyze_sentiment(title)
+                    title_lower = title.lower()
+                    sentiment_score, _ = self.analyze_sentiment(title_lower, is_lower=True)
                     
                     # Calculate relevance (how many query words appear in title)
-                    query_words = set(query.lower().split())
-                    title_words = set(title.lower().split())
-                    relevance = len(query_words & title_words) / len(query_words) if query_words else 0
+                    matched_words = query_words.intersection(title_lower.split())
+                    relevance = len(matched_words) / len(query_words) if query_words else 0
                     
                     articles.append(NewsArticle(
                         title=title,
@@ -294,7 +658,7 @@ class NewsAnalyzer:
                         url=url,
                         timestamp=pub_date,
                         content_snippet=title,  # Using title as snippet
-                        keywords=list(query_words & title_words),
+                        keywords=list(matched_words),
                         sentiment_score=sentiment_score,
                         relevance_score=min(relevance + 0.3, 1.0),  # Boost relevance slightly
                     ))
@@ -306,58 +670,83 @@ class NewsAnalyzer:
     
     def get_news_for_market(self, market_id: str, question: str) -> List[NewsArticle]:
         """Get recent news articles relevant to a market."""
-        cache_key = hashlib.md5(question.encode()).hexdigest()[:12]
-        
-        # Check cache
-        if cache_key in self._news_cache:
-            cached_time, cached_articles = self._news_cache[cache_key]
-            if datetime.now(timezone.utc) - cached_time < self.cache_duration:
-                return cached_articles
-        
         # Extract keywords and search
         keywords = self._extract_keywords(question)
         if not keywords:
             return []
         
-        # Create search query
+        # Create search query; differently worded questions often share one
         search_query = " ".join(keywords[:3])
         
-        # Fetch news
-        articles = self._fetch_news_rss(search_query)
-        
-        # Sort by relevance and recency
-        articles.sort(key=lambda a: (a.relevance_score * 0.6 + abs(a.sentiment_score) * 0.4), reverse=True)
+        # Check cache
+        cached_articles = self._news_cache.get(search_query)
+        if cached_articles is not None:
+            return cached_articles
         
-        # Cache results
-        self._news_cache[cache_key] = (datetime.now(timezone.utc), articles)
+        return self._fetch_news_coalesced(search_query)[:10]  # Top 10
+    
+    def _fetch_news_coalesced(self, query: str) -> List[NewsArticle]:
+        """Fetch and cache news for a query, sharing one request between concurrent callers."""
+        with self._inflight_lock:
+            future = self._inflight.get(query)
+            is_owner = future is None
+            if is_owner:
+                future = Future()
+                self._inflight[query] = future
+        
+        if not is_owner:
+            return future.result()
         
-        return articles[:10]  # Top 10
+        try:
+            # Fetch news
+            articles = self._fetch_news_rss(query)
+            
+            # Sort by relevance and recency
+            articles.sort(key=lambda a: (a.relevance_score * 0.6 + abs(a.sentiment_score) * 0.4), reverse=True)
+            
+            # Cache results before releasing waiters so later callers hit the cache
+            self._news_cache[query] = articles
+            future.set_result(articles)
+            return articles
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[query]
     
     def generate_signal(self, market_id: str, question: str, current_price: float) -> Optional[MarketSignal]:
         """Generate a trading signal for a market based on news sentiment."""
-        # Detect category
-        category = self.detect_category(question)
-        
         # Get news
         articles = self.get_news_for_market(market_id, question)
         
         if not articles:
             return None
         
-        # Aggregate sentiment
+        # Aggregate sentiment and bucket positive/negative articles in one pass
         total_sentiment = 0.0
         total_weight = 0.0
+        bullish_articles: List[NewsArticle] = []
+        bearish_articles: List[NewsArticle] = []
         
         for article in articles:
+            score = article.sentiment_score
             weight = article.relevance_score
-            total_sentiment += article.sentiment_score * weight
+            total_sentiment += score * weight
             total_weight += weight
+            if score > 0.1:
+                bullish_articles.append(article)
+            elif score < -0.1:
+                bearish_articles.append(article)
         
         if total_weight == 0:
             return None
         
         avg_sentiment = total_sentiment / total_weight
         
+        # Detect category
+        category = self.detect_category(question)
+        
         # Determine overall sentiment
         if avg_sentiment > 0.4:
             sentiment = Sentiment.VERY_BULLISH
@@ -377,7 +766,6 @@ class NewsAnalyzer:
         
         # Bullish signals
         if sentiment in [Sentiment.BULLISH, Sentiment.VERY_BULLISH]:
-            bullish_articles = [a for a in articles if a.sentiment_score > 0.1]
             if bullish_articles:
                 reasons.append(f"{len(bullish_articles)} positive news articles found")
                 reasons.append(f"Top headline: {bullish_articles[0].title[:60]}...")
@@ -389,7 +777,6 @@ class NewsAnalyzer:
         
         # Bearish signals
         elif sentiment in [Sentiment.BEARISH, Sentiment.VERY_BEARISH]:
-            bearish_articles = [a for a in articles if a.sentiment_score < -0.1]
             if bearish_articles:
                 reasons.append(f"{len(bearish_articles)} negative news articles found")
                 reasons.append(f"Top headline: {bearish_articles[0].title[:60]}...")
@@ -443,30 +830,46 @@ class NewsAnalyzer:
             return
         
         self._running = True
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.ANALYSIS_WORKERS,
+            thread_name_prefix="news-analyzer",
+        )
         self._thread = threading.Thread(target=self._analysis_loop, daemon=True)
         self._thread.start()
     
     def stop(self) -> None:
         """Stop background analysis."""
         self._running = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
     
     def _analysis_loop(self) -> None:
         """Background loop to analyze markets."""
         while self._running:
             try:
-                # Analyze each market
-                for market_id, info in list(self._markets_to_analyze.items()):
-                    if not self._running:
-                        break
-                    
-                    self.generate_signal(market_id, info["question"], info["price"])
-                    time.sleep(2)  # Rate limit
+                # Analyze markets concurrently; the limiter paces RSS requests
+                executor = self._executor
+                if executor is None:
+                    break
+                markets = list(self._markets_to_analyze.items())
+                list(executor.map(self._analyze_market, markets))
                 
                 # Wait before next round
                 time.sleep(60)
                 
             except Exception:
                 time.sleep(10)
+    
+    def _analyze_market(self, item: Tuple[str, Dict]) -> None:
+        """Generate a signal for one queued market (runs on a worker thread)."""
+        if not self._running:
+            return
+        market_id, info = item
+        try:
+            self.generate_signal(market_id, info["question"], info["price"])
+        except Exception:
+            pass
 
 
 # Utility function
@@ -2,12 +2,46 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import sys
+import threading
+import time
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _dumps(data: Dict) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+
+@lru_cache(maxsize=1024)
+def _position_key(market_id: str, outcome: str) -> str:
+    """Build the interned "market_id|outcome" positions key (recent pairs cached)."""
+    return sys.intern(f"{market_id}|{outcome}")
+
+# dataclass(slots=True) needs Python 3.10+; these classes have field
+# defaults, so a hand-written __slots__ would clash with them. Older
+# interpreters get the same dataclasses without slots.
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class TradeAction(Enum):
@@ -15,7 +49,10 @@ class TradeAction(Enum):
     SELL = "sell"
 
 
-@dataclass
+_TRADE_ACTIONS = {action.value: action for action in TradeAction}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PaperPosition:
     """Represents a paper trading position."""
     market_id: str
@@ -28,25 +65,41 @@ class PaperPosition:
     current_bid: Optional[float] = None
     current_ask: Optional[float] = None
     resolution_datetime: Optional[str] = None
+    # shares * average_price, kept in step by PaperTrader.buy/sell
+    _cost_basis: float = field(default=0.0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        self._cost_basis = self.shares * self.average_price
     
     @property
     def cost_basis(self) -> float:
-        return self.shares * self.average_price
+        return self._cost_basis
+    
+    @property
+    def mark_price(self) -> float:
+        """Price used to value the position: bid, else last price, else entry."""
+        # A 0.0 bid is a real quote (nobody bidding), not a missing one
+        price = self.current_bid
+        if price is None:
+            price = self.current_price
+            if price is None:
+                price = self.average_price
+        return price
     
     @property
     def market_value(self) -> float:
-        price = self.current_bid or self.current_price or self.average_price
-        return self.shares * price
+        return self.shares * self.mark_price
     
     @property
     def unrealized_pnl(self) -> float:
-        return self.market_value - self.cost_basis
+        return self.market_value - self._cost_basis
     
     @property
     def unrealized_pnl_pct(self) -> float:
-        if self.cost_basis <= 0:
+        cost_basis = self._cost_basis
+        if cost_basis <= 0:
             return 0.0
-        return (self.unrealized_pnl / self.cost_basis) * 100
+        return ((self.market_value - cost_basis) / cost_basis) * 100
     
     def key(self) -> str:
         return f"{self.market_id}|{self.outcome}"
@@ -70,7 +123,7 @@ class PaperPosition:
         return PaperPosition(**data)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PaperTrade:
     """Represents a single paper trade."""
     id: str
@@ -106,24 +159,27 @@ class PaperTrade:
     
     @staticmethod
     def from_dict(data: Dict) -> "PaperTrade":
+        # Positional args in field order and a dict lookup instead of
+        # TradeAction(...) keep journal replay cheap for long histories
+        get = data.get
         return PaperTrade(
-            id=data["id"],
-            timestamp=data["timestamp"],
-            action=TradeAction(data["action"]),
-            market_id=data["market_id"],
-            outcome=data["outcome"],
-            question=data["question"],
-            shares=data["shares"],
-            price=data["price"],
-            value=data["value"],
-            fees=data.get("fees", 0.0),
-            slippage_bps=data.get("slippage_bps", 0.0),
-            notes=data.get("notes", ""),
-            pnl=data.get("pnl"),
+            data["id"],
+            data["timestamp"],
+            _TRADE_ACTIONS[data["action"]],
+            data["market_id"],
+            data["outcome"],
+            data["question"],
+            data["shares"],
+            data["price"],
+            data["value"],
+            get("fees", 0.0),
+            get("slippage_bps", 0.0),
+            get("notes", ""),
+            get("pnl"),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class PaperPortfolio:
     """Paper trading portfolio state."""
     initial_capital: float = 10000.0
@@ -161,18 +217,20 @@ class PaperPortfolio:
             return 0.0
         return (self.winning_trades / self.total_trades) * 100
     
-    def to_dict(self) -> Dict:
-        return {
+    def to_dict(self, include_history: bool = True) -> Dict:
+        data = {
             "initial_capital": self.initial_capital,
             "cash_balance": self.cash_balance,
             "positions": {k: v.to_dict() for k, v in self.positions.items()},
-            "trade_history": [t.to_dict() for t in self.trade_history],
             "realized_pnl": self.realized_pnl,
             "total_trades": self.total_trades,
             "winning_trades": self.winning_trades,
             "losing_trades": self.losing_trades,
             "created_at": self.created_at,
         }
+        if include_history:
+            data["trade_history"] = [t.to_dict() for t in self.trade_history]
+        return data
     
     @staticmethod
     def from_dict(data: Dict) -> "PaperPortfolio":
@@ -197,28 +255,70 @@ class PaperPortfolio:
 
 
 class PaperTrader:
-    """Paper trading engine that simulates trades without real money."""
+    """
+    Paper trading engine that simulates trades without real money.
+    
+    State is persisted as a small snapshot (cash, positions, counters) at
+    ``storage_path`` plus an append-only JSONL journal of trades next to it,
+    so each save writes the new trades only instead of the whole history.
+    Disk writes happen on a background thread; call ``flush()`` to wait
+    for them.
+    """
     
     EXCHANGE_FEE = 0.02  # 2% fee on winning trades
+    PRICE_SAVE_INTERVAL = 60.0  # Max seconds price-only updates stay unsaved
     
     def __init__(self, storage_path: Optional[Path] = None, initial_capital: float = 10000.0):
         self.storage_path = storage_path or Path("paper_portfolio.json")
+        self.journal_path = self.storage_path.with_suffix(".trades.jsonl")
+        # Number of trades already in the journal; None forces a full rewrite
+        self._journaled: Optional[int] = None
+        # Monotonic trade id counter, persisted in the snapshot
+        self._trade_counter = 0
         self.portfolio: PaperPortfolio = self._load_or_create(initial_capital)
-        self._trade_counter = len(self.portfolio.trade_history)
+        
+        # Serializes save()/reset() between the UI and price-refresh threads
+        self._save_lock = threading.RLock()
+        # Pending writes, coalesced until the writer thread picks them up
+        self._write_cond = threading.Condition()
+        self._write_failed = False  # Set by the writer; save() then rewrites the journal
+        self._pending_rewrite = False
+        self._pending_journal: List[bytes] = []
+        self._pending_snapshot: Optional[bytes] = None
+        self._writing = False
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="paper-trader-writer", daemon=True
+        )
+        self._writer.start()
+        # Price ticks only mark the portfolio dirty; see update_position_prices
+        self._prices_dirty = False
+        self._last_save = time.monotonic()
+        atexit.register(self._save_on_exit)
     
     def _now_iso(self) -> str:
         return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
     
     def _generate_trade_id(self) -> str:
+        # Epoch nanoseconds avoid strftime formatting; new ids sort among
+        # themselves (not against older paper_YYYYmmdd... ids), and the
+        # readable time is in PaperTrade.timestamp
         self._trade_counter += 1
-        return f"paper_{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}_{self._trade_counter}"
+        return f"paper_{time.time_ns()}_{self._trade_counter}"
+    
+    def _position_key(self, market_id: str, outcome: str) -> str:
+        """Return the positions key for a market/outcome pair."""
+        return _position_key(market_id, outcome)
     
     def _load_or_create(self, initial_capital: float) -> PaperPortfolio:
         """Load existing portfolio or create new one."""
         if self.storage_path.exists():
             try:
-                data = json.loads(self.storage_path.read_text())
-                return PaperPortfolio.from_dict(data)
+                data = _loads(self.storage_path.read_bytes())
+                portfolio = PaperPortfolio.from_dict(data)
+                if "trade_history" not in data:
+                    portfolio.trade_history = self._load_journal(data.get("journaled_trades", 0))
+                self._trade_counter = data.get("trade_counter", len(portfolio.trade_history))
+                return portfolio
             except Exception:
                 pass
         
@@ -228,24 +328,124 @@ class PaperTrader:
             created_at=self._now_iso(),
         )
     
+    def _load_journal(self, count: int) -> List[PaperTrade]:
+        """Replay up to ``count`` trades from the journal."""
+        trades: List[PaperTrade] = []
+        self._journaled = 0
+        if not self.journal_path.exists():
+            return trades
+        with self.journal_path.open("rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                if len(trades) >= count:
+                    # Lines past the snapshot's count were never committed;
+                    # rewrite the journal on the next save to drop them.
+                    self._journaled = None
+                    break
+                trades.append(PaperTrade.from_dict(_loads(line)))
+        if self._journaled is not None:
+            self._journaled = len(trades)
+        return trades
+    
     def save(self) -> None:
-        """Persist portfolio to disk."""
-        try:
-            self.storage_path.write_text(
-                json.dumps(self.portfolio.to_dict(), indent=2)
+        """Queue the current portfolio state for the background writer."""
+        with self._save_lock:
+            with self._write_cond:
+                if self._write_failed:
+                    # The journal may be missing lines; rebuild it this time
+                    self._write_failed = False
+                    self._journaled = None
+            
+            try:
+                history = self.portfolio.trade_history
+                count = len(history)
+                start = self._journaled
+                rewrite = start is None or start > count
+                if rewrite:
+                    start = 0
+                lines = b"".join(_dumps(t.to_dict()) + b"\n" for t in history[start:count])
+            
+                data = self.portfolio.to_dict(include_history=False)
+                data["journaled_trades"] = count
+                data["trade_counter"] = self._trade_counter
+                snapshot = _dumps(data)
+            except Exception as e:
+                # Nothing is committed, so the next save retries these trades
+                print(f"Failed to save paper portfolio: {e}")
+                return
+            
+            with self._write_cond:
+                if rewrite:
+                    # A full rewrite supersedes any appends still queued
+                    self._pending_rewrite = True
+                    self._pending_journal = [lines]
+                elif lines:
+                    self._pending_journal.append(lines)
+                self._pending_snapshot = snapshot
+                self._write_cond.notify_all()
+            # Only mark trades journaled once their lines are queued
+            self._journaled = count
+            self._prices_dirty = False
+            self._last_save = time.monotonic()
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until queued saves are on disk. Returns False on timeout."""
+        with self._write_cond:
+            return self._write_cond.wait_for(
+                lambda: self._pending_snapshot is None and not self._writing,
+                timeout,
             )
-        except Exception as e:
-            print(f"Failed to save paper portfolio: {e}")
+    
+    def _save_on_exit(self) -> None:
+        """Persist unsaved price updates and wait for the writer."""
+        if self._prices_dirty:
+            self.save()
+        self.flush()
+    
+    def _writer_loop(self) -> None:
+        """Write queued journal lines and snapshots to disk."""
+        while True:
+            with self._write_cond:
+                self._write_cond.wait_for(lambda: self._pending_snapshot is not None)
+                rewrite, chunks, snapshot = (
+                    self._pending_rewrite, self._pending_journal, self._pending_snapshot
+                )
+                self._pending_rewrite = False
+                self._pending_journal = []
+                self._pending_snapshot = None
+                self._writing = True
+            
+            try:
+                if rewrite or chunks:
+                    with self.journal_path.open("wb" if rewrite else "ab") as f:
+                        f.writelines(chunks)
+                tmp_path = self.storage_path.with_name(f"{self.storage_path.name}.tmp")
+                tmp_path.write_bytes(snapshot)
+                os.replace(tmp_path, self.storage_path)
+            except Exception as e:
+                print(f"Failed to save paper portfolio: {e}")
+                failed = True
+            else:
+                failed = False
+            finally:
+                with self._write_cond:
+                    if failed:
+                        self._write_failed = True
+                    self._writing = False
+                    self._write_cond.notify_all()
     
     def reset(self, initial_capital: float = 10000.0) -> None:
         """Reset the paper portfolio."""
-        self.portfolio = PaperPortfolio(
-            initial_capital=initial_capital,
-            cash_balance=initial_capital,
-            created_at=self._now_iso(),
-        )
-        self._trade_counter = 0
-        self.save()
+        with self._save_lock:
+            self.portfolio = PaperPortfolio(
+                initial_capital=initial_capital,
+                cash_balance=initial_capital,
+                created_at=self._now_iso(),
+            )
+            self._trade_counter = 0
+            self._journaled = None
+            self.save()
     
     def buy(
         self,
@@ -273,18 +473,21 @@ class PaperTrader:
         if cost > self.portfolio.cash_balance:
             return False, f"Insufficient funds. Need ${cost:.2f}, have ${self.portfolio.cash_balance:.2f}", None
         
+        timestamp = self._now_iso()
+        
         # Deduct cash
         self.portfolio.cash_balance -= cost
         
         # Update or create position
-        key = f"{market_id}|{outcome}"
+        key = self._position_key(market_id, outcome)
         if key in self.portfolio.positions:
             pos = self.portfolio.positions[key]
             # Average up/down
-            total_cost = pos.cost_basis + cost
+            total_cost = pos._cost_basis + cost
             total_shares = pos.shares + shares
             pos.average_price = total_cost / total_shares
             pos.shares = total_shares
+            pos._cost_basis = total_cost
         else:
             self.portfolio.positions[key] = PaperPosition(
                 market_id=market_id,
@@ -292,7 +495,7 @@ class PaperTrader:
                 question=question,
                 shares=shares,
                 average_price=price,
-                entry_timestamp=self._now_iso(),
+                entry_timestamp=timestamp,
                 current_price=price,
                 current_ask=price,
                 resolution_datetime=resolution_datetime,
@@ -301,7 +504,7 @@ class PaperTrader:
         # Record trade
         trade = PaperTrade(
             id=self._generate_trade_id(),
-            timestamp=self._now_iso(),
+            timestamp=timestamp,
             action=TradeAction.BUY,
             market_id=market_id,
             outcome=outcome,
@@ -329,7 +532,7 @@ class PaperTrader:
         
         Returns: (success, message, trade)
         """
-        key = f"{market_id}|{outcome}"
+        key = self._position_key(market_id, outcome)
         
         if key not in self.portfolio.positions:
             return False, "No position to sell", None
@@ -347,6 +550,8 @@ class PaperTrader:
         cost_basis = shares * pos.average_price
         pnl = proceeds - cost_basis
         
+        timestamp = self._now_iso()
+        
         # Update cash
         self.portfolio.cash_balance += proceeds
         
@@ -360,13 +565,14 @@ class PaperTrader:
         
         # Update position
         pos.shares -= shares
+        pos._cost_basis -= cost_basis
         if pos.shares <= 0.0001:
             del self.portfolio.positions[key]
         
         # Record trade
         trade = PaperTrade(
             id=self._generate_trade_id(),
-            timestamp=self._now_iso(),
+            timestamp=timestamp,
             action=TradeAction.SELL,
             market_id=market_id,
             outcome=outcome,
@@ -385,7 +591,7 @@ class PaperTrader:
     
     def sell_all(self, market_id: str, outcome: str, price: float, notes: str = "") -> Tuple[bool, str, Optional[PaperTrade]]:
         """Sell entire position."""
-        key = f"{market_id}|{outcome}"
+        key = self._position_key(market_id, outcome)
         if key not in self.portfolio.positions:
             return False, "No position to sell", None
         
@@ -401,7 +607,7 @@ class PaperTrader:
         current_ask: Optional[float] = None,
     ) -> None:
         """Update current market prices for a position."""
-        key = f"{market_id}|{outcome}"
+        key = self._position_key(market_id, outcome)
         if key in self.portfolio.positions:
             pos = self.portfolio.positions[key]
             if current_price is not None:
@@ -410,11 +616,15 @@ class PaperTrader:
                 pos.current_bid = current_bid
             if current_ask is not None:
                 pos.current_ask = current_ask
-            self.save()
+            # Quotes are transient: persist them at most once per interval
+            # (and on exit) instead of on every tick
+            self._prices_dirty = True
+            if time.monotonic() - self._last_save >= self.PRICE_SAVE_INTERVAL:
+                self.save()
     
     def get_position(self, market_id: str, outcome: str) -> Optional[PaperPosition]:
         """Get a specific position."""
-        key = f"{market_id}|{outcome}"
+        key = self._position_key(market_id, outcome)
         return self.portfolio.positions.get(key)
     
     def get_all_positions(self) -> List[PaperPosition]:
@@ -423,25 +633,40 @@ class PaperTrader:
     
     def get_trade_history(self, limit: int = 50) -> List[PaperTrade]:
         """Get recent trade history."""
-        return list(reversed(self.portfolio.trade_history[-limit:]))
+        history = self.portfolio.trade_history
+        return list(islice(reversed(history), limit if limit > 0 else None))
     
     def get_summary(self) -> Dict:
         """Get portfolio summary statistics."""
+        portfolio = self.portfolio
+        
+        # One pass for market value and cost basis instead of re-walking
+        # the positions for each aggregate
+        position_value = 0.0
+        cost_basis = 0.0
+        for p in portfolio.positions.values():
+            position_value += p.shares * p.mark_price
+            cost_basis += p._cost_basis
+        
+        unrealized_pnl = position_value - cost_basis
+        total_pnl = portfolio.realized_pnl + unrealized_pnl
+        initial_capital = portfolio.initial_capital
+        
         return {
-            "initial_capital": self.portfolio.initial_capital,
-            "cash_balance": self.portfolio.cash_balance,
-            "position_value": self.portfolio.total_position_value,
-            "total_value": self.portfolio.total_value,
-            "realized_pnl": self.portfolio.realized_pnl,
-            "unrealized_pnl": sum(p.unrealized_pnl for p in self.portfolio.positions.values()),
-            "total_pnl": self.portfolio.total_pnl,
-            "total_pnl_pct": self.portfolio.total_pnl_pct,
-            "total_trades": self.portfolio.total_trades,
-            "winning_trades": self.portfolio.winning_trades,
-            "losing_trades": self.portfolio.losing_trades,
-            "win_rate": self.portfolio.win_rate,
-            "open_positions": len(self.portfolio.positions),
-            "created_at": self.portfolio.created_at,
+            "initial_capital": initial_capital,
+            "cash_balance": portfolio.cash_balance,
+            "position_value": position_value,
+            "total_value": portfolio.cash_balance + position_value,
+            "realized_pnl": portfolio.realized_pnl,
+            "unrealized_pnl": unrealized_pnl,
+            "total_pnl": total_pnl,
+            "total_pnl_pct": (total_pnl / initial_capital) * 100 if initial_capital > 0 else 0.0,
+            "total_trades": portfolio.total_trades,
+            "winning_trades": portfolio.winning_trades,
+            "losing_trades": portfolio.losing_trades,
+            "win_rate": portfolio.win_rate,
+            "open_positions": len(portfolio.positions),
+            "created_at": portfolio.created_at,
         }
 
 
@@ -457,7 +682,12 @@ def calculate_simulated_fill(
     if not asks or target_value <= 0:
         return 0.0, 0.0, 0.0
     
-    best_price = asks[0][0]
+    best_price, best_size = asks[0]
+    
+    # Most orders fit inside the top level: no walk, no slippage
+    if best_price > 0 and best_size > 0 and target_value <= best_price * best_size:
+        return target_value / best_price, best_price, 0.0
+    
     total_cost = 0.0
     total_shares = 0.0
     remaining_value = target_value